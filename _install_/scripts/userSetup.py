@@ -2,11 +2,12 @@
 import os
 import sys
 import site
-import inspect
 
 def common_startup():
     # Add site-packages to sys.path
-    package_dir = os.path.dirname(os.path.dirname(os.path.dirname(inspect.getfile(inspect.currentframe())))) # my god
+    # Maya doesn't always define __file__ when running userSetup.py, the code object knows where it came from
+    this_file = os.path.abspath(common_startup.__code__.co_filename)
+    package_dir = os.path.dirname(os.path.dirname(os.path.dirname(this_file)))
     
     if package_dir not in sys.path:
         site.addsitedir(package_dir)
@@ -3,8 +3,10 @@ import sys
 
 from . import tool_dock_dcc_base as base_dcc_module
 
-currently_using_maya = os.path.basename(sys.executable) == "maya.exe"
-currently_using_mobu = os.path.basename(sys.executable) == "motionbuilder.exe"
+# maya.exe on Windows, maya / maya.bin on Linux and macOS
+executable_name = os.path.splitext(os.path.basename(sys.executable))[0].lower()
+currently_using_maya = executable_name == "maya"
+currently_using_mobu = executable_name == "motionbuilder"
 currently_using_standalone = False
 
 if currently_using_maya:
@@ -189,7 +189,10 @@ class ToolDockWindow(ui_utils.DockableWidget, QtWidgets.QMainWindow):
                 s_sizes = splitter_data.get("sizes")
                 s_orientation = QtCore.Qt.Horizontal if splitter_data.get("orientation") == 1 else QtCore.Qt.Vertical
 
-                tool_item.main_splitter.setSizes(s_sizes)
+                # sizes are applied by position, layouts saved with a parameter grid the tool no longer builds
+                # up front would otherwise give the run widget the grid's size
+                if s_sizes and len(s_sizes) == tool_item.main_splitter.count():
+                    tool_item.main_splitter.setSizes(s_sizes)
                 tool_item.main_splitter.setOrientation(s_orientation)
 
         # restore parameter_grid header sizes
@@ -197,6 +200,9 @@ class ToolDockWindow(ui_utils.DockableWidget, QtWidgets.QMainWindow):
         if parameter_grid_ui_settings:
             for dock_widget in self.tool_dock_widgets:
                 tool_item = dock_widget.widget()  # type:tdu.ToolDockItemBase
+                if not tool_item.has_param_grid():
+                    continue
+
                 tool_param_grid = parameter_grid_ui_settings.get(tool_item.TOOL_NAME)
                 if not tool_param_grid:
                     continue
@@ -218,7 +224,8 @@ class ToolDockWindow(ui_utils.DockableWidget, QtWidgets.QMainWindow):
             tool_item = dock_widget.widget()  # type:tdu.ToolDockItemBase
 
             # save parameter_grid settings
-            parameter_grids[tool_item.TOOL_NAME] = tool_item.param_grid.get_ui_settings()
+            if tool_item.has_param_grid():
+                parameter_grids[tool_item.TOOL_NAME] = tool_item.param_grid.get_ui_settings()
 
             # save main_splitter settings
             splitter_data = dict()
@@ -272,7 +279,7 @@ class ToolDockWindow(ui_utils.DockableWidget, QtWidgets.QMainWindow):
 
         # Build right click menu
         action_list = [
-            {"Delete Spacer": lambda: self.ui_delete_spacer(dock)}
+            ("Delete Spacer", lambda: self.ui_delete_spacer(dock))
         ]
 
         dock.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
@@ -1,21 +1,27 @@
+import atexit
 import collections
 import importlib
 import inspect
+import itertools
+import json
 import os
-import runpy
 import sys
+import tempfile
+import threading
+import time
 import traceback
-from copy import copy
-from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy, deepcopy
+from functools import lru_cache, partial
 
 from tool_dock import dcc
-from tool_dock.ui import parameter_grid
 from tool_dock.ui import ui_utils
 from tool_dock.ui.ui_utils import QtCore, QtWidgets, QtGui
 
-PY_2 = sys.version_info[0] < 3
 background_form = "background-color:rgb({0}, {1}, {2})"
 dcc_interface = dcc.Interface()
+_MISSING = object()
+_TRUE_VALUES = frozenset(("true", "True", "1", 1, True))  # QSettings ini files store bools as strings
 
 
 class RequiresValueType(object):
@@ -23,9 +29,73 @@ class RequiresValueType(object):
     pass
 
 
+def _detached(val):
+    """copy containers so cached settings values can't be modified from the outside"""
+    if isinstance(val, (list, dict)):
+        return deepcopy(val)
+    return val
+
+
 class ToolDockSettings(QtCore.QSettings):
     def __init__(self, *args, **kwargs):
         super(ToolDockSettings, self).__init__(*args, **kwargs)
+        # in-memory copy of the values read or written, so lookups don't have to go through QSettings
+        self._cache = {}  # (group, key): value
+        self._written_keys = set()  # cache keys set by this instance, only these can skip unchanged writes
+        self._file_mtime = self._get_file_mtime()
+
+    def _get_file_mtime(self):
+        try:
+            return os.stat(self.fileName()).st_mtime
+        except OSError:
+            return None
+
+    def _reload_if_file_changed(self):
+        """another tool dock instance or DCC session may have written the ini file since it was cached"""
+        if self._get_file_mtime() != self._file_mtime:
+            self.sync()
+
+    def _clear_cache(self):
+        self._cache.clear()
+        self._written_keys.clear()
+
+    def value(self, key, defaultValue=None, type=None):
+        if type is not None:
+            # let QSettings do the conversion, converted values aren't cached
+            return super(ToolDockSettings, self).value(key, defaultValue, type=type)
+
+        self._reload_if_file_changed()
+        cache_key = (self.group(), key)
+        if cache_key not in self._cache:
+            self._cache[cache_key] = super(ToolDockSettings, self).value(key)
+
+        settings_val = self._cache[cache_key]
+        if settings_val is None:
+            return defaultValue
+        return _detached(settings_val)
+
+    def setValue(self, key, value):
+        self._reload_if_file_changed()
+        cache_key = (self.group(), key)
+        if cache_key in self._written_keys and self._cache.get(cache_key, _MISSING) == value:
+            return  # nothing changed since this instance wrote it, skip the write
+
+        self._cache[cache_key] = _detached(value)
+        self._written_keys.add(cache_key)
+        super(ToolDockSettings, self).setValue(key, value)
+
+    def remove(self, key):
+        self._clear_cache()  # key can be a whole group
+        super(ToolDockSettings, self).remove(key)
+
+    def clear(self):
+        self._clear_cache()
+        super(ToolDockSettings, self).clear()
+
+    def sync(self):
+        self._clear_cache()
+        super(ToolDockSettings, self).sync()
+        self._file_mtime = self._get_file_mtime()
 
     def get_value(self, key, default=None):
         data_type = None
@@ -35,27 +105,37 @@ class ToolDockSettings(QtCore.QSettings):
         settings_val = self.value(key, defaultValue=default)
 
         # safety for list types
-        if data_type == list and not isinstance(settings_val, list):
+        if data_type is list and not isinstance(settings_val, list):
             settings_val = [settings_val] if settings_val else list()
 
         # safety for dict types
-        if data_type == dict and not isinstance(settings_val, dict):
+        if data_type is dict and not isinstance(settings_val, dict):
             settings_val = dict(settings_val)
 
         # safety for int types
-        if data_type == int and not isinstance(settings_val, int):
+        if data_type is int and not isinstance(settings_val, int):
             settings_val = default if settings_val is None else int(settings_val)
 
         # safety for float types
-        if data_type == float and not isinstance(settings_val, float):
+        if data_type is float and not isinstance(settings_val, float):
             settings_val = default if settings_val is None else float(settings_val)
 
         # safety convert bool to proper type
-        if data_type == bool:
-            settings_val = True if settings_val in ("true", "True", "1", 1, True) else False
+        if data_type is bool:
+            # isinstance check since unhashable values can't be looked up in the set
+            settings_val = isinstance(settings_val, (str, int, float)) and settings_val in _TRUE_VALUES
 
         return settings_val
 
+    def get_keys_in_group(self, group):
+        """Full key paths of all settings in group, filtered by QSettings instead of looping over allKeys()"""
+        self.beginGroup(group)
+        try:
+            group_keys = self.allKeys()
+        finally:
+            self.endGroup()
+        return ["{}/{}".format(group, key) for key in group_keys]
+
     def set_user_color(self, tool_name, color):
         user_colors = self.get_value(lk.user_colors, default=dict())
         user_colors[tool_name] = color
@@ -74,7 +154,8 @@ class ToolDockSettings(QtCore.QSettings):
 class LocalConstants(object):
     # generate custom py scripts from folder
     dynamic_classes_generated = False
-    dynamic_classes = {}
+    dynamic_classes = {}  # script_path: tool class
+    dynamic_class_names = set()  # TOOL_NAME of every dynamic class, tool names have to be unique
 
     env_extra_modules = "TOOL_DOCK_EXTRA_MODULES"
     env_script_folders = "TOOL_DOCK_SCRIPT_FOLDERS"
@@ -95,20 +176,60 @@ class LocalConstants(object):
     # script files in this folder structure will be added as dynamic classes
     script_folders = os.environ.get(env_script_folders, "D:/Google Drive/Scripting/_Scripts___")
 
+    def __init__(self):
+        self._folder_script_paths = []
+        self._script_search_thread = None
+        self._searched_script_folders = None  # script_folders value the search thread was started with
+
+    def start_script_folder_search(self):
+        """
+        Search the script folders in a background thread, so the UI doesn't have to wait on the file system
+        the classes themselves are created on the main thread in generate_dynamic_classes
+        """
+        if self._script_search_thread is not None:
+            if self._searched_script_folders == self.script_folders:
+                return
+
+            # script_folders changed since the search started, wait for it so it can't overwrite the new results
+            self._script_search_thread.join()
+
+        self._searched_script_folders = self.script_folders
+        self._folder_script_paths = []
+        self._script_search_thread = threading.Thread(target=self._find_folder_script_paths,
+                                                      args=(self.script_folders,))
+        self._script_search_thread.daemon = True
+        self._script_search_thread.start()
+
+    def _find_folder_script_paths(self, script_folders_str):
+        try:
+            if not script_folders_str:
+                return
+
+            # ignore empty strings and missing folders
+            script_folders = [f for f in script_folders_str.split(";") if f and os.path.exists(f)]
+            if not script_folders:
+                return
+
+            # listing folders is the slow part (network drives), so sub folders are listed in parallel
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                self._folder_script_paths = [get_script_paths_in_folder(script_folder, executor=executor)
+                                             for script_folder in script_folders]
+        except Exception:
+            traceback.print_exc()
+
     def generate_dynamic_classes(self):
         if not self.script_folders:
             return
 
-        for script_folder in self.script_folders.split(";"):
-            if not script_folder:  # ignore empty strings
-                continue
-
-            if not os.path.exists(script_folder):
-                continue
-
-            self.dynamic_classes_from_script_folder(script_folder)
+        # classes are created in folder order, so the first script with a given name wins
+        # (searches again if script_folders was changed after import)
+        self.start_script_folder_search()
+        self._script_search_thread.join()
+        for script_paths in self._folder_script_paths:
+            for script_path in script_paths:
+                self.dynamic_class_from_script(script_path)
 
-        if len(self.dynamic_classes.keys()) > 0:
+        if self.dynamic_classes:
             print("Generated: {} tool(s) from files in: {}".format(len(self.dynamic_classes), self.script_folders))
 
         # generate classes user specified script paths
@@ -120,7 +241,7 @@ class LocalConstants(object):
 
     def dynamic_classes_from_script_folder(self, script_folder):
         """Find all scripts in folder structure and add them as tool classes"""
-        for script_path in get_paths_in_folder(script_folder, extension_filter=".py"):
+        for script_path in get_script_paths_in_folder(script_folder):
             self.dynamic_class_from_script(script_path)
 
     def dynamic_classes_from_user_settings(self):
@@ -142,14 +263,26 @@ class LocalConstants(object):
 
     # for dynamic class creation in custom modules
     def dynamic_class_from_script(self, script_path):
-        script_name = os.path.splitext(os.path.basename(script_path))[0]
-        if script_name in self.dynamic_classes.keys():
+        dynamic_classes = self.dynamic_classes
+        script_path = script_path.replace("\\", "/")  # backslash safety
+        if script_path in dynamic_classes:
+            return
+
+        # plain string ops, this runs for every script in the script folders
+        script_name = script_path.rpartition("/")[2]
+        if script_name.endswith(".py"):
+            script_name = script_name[:-3]
+        else:
+            script_name = os.path.splitext(script_name)[0]
+
+        if script_name in self.dynamic_class_names:
+            print("Skipped script, a tool named '{}' already exists: {}".format(script_name, script_path))
             return
 
-        script_path = script_path.replace("\\", "/")  # backslash safety
         script_cls = make_class_from_script(script_path, tool_name=script_name)
 
-        self.dynamic_classes[script_name] = script_cls
+        dynamic_classes[script_path] = script_cls
+        self.dynamic_class_names.add(script_name)
 
         return script_cls
 
@@ -171,6 +304,27 @@ class _InternalToolDockItemBase(QtWidgets.QWidget):
     SCRIPT_PATH = None  # used by dynamically generated classes
     IS_USER_SCRIPT = False  # is set to true for dynamically generated user scripts
 
+    # (label, method name, method args) shared by all tools, bound to the instance when the menu is first opened
+    _INTERNAL_CONTEXT_MENU_ACTIONS = (
+        ("Set Label", "open_button_label_editor", ()),
+        ("Set Background Color", "open_background_color_picker", ()),
+        "-",
+        ("Set Splitter - Vertical", "set_splitter_orientation", (True,)),
+        ("Set Splitter - Horizontal", "set_splitter_orientation", (False,)),
+        "-",
+        ("Reset Label", "reset_tool_label", ()),
+        ("Reset Background Color", "reset_background_color", ()),
+    )
+
+    _RUN_IS_STUB = True  # set to False for subclasses that implement their own 'run'
+    _CACHED_RUN_ARGS = ()  # (name, default) pairs of 'run' arguments, read once per class
+
+    def __init_subclass__(cls, **kwargs):
+        super(_InternalToolDockItemBase, cls).__init_subclass__(**kwargs)
+        cls._RUN_IS_STUB = cls.run is _InternalToolDockItemBase.run
+        if not cls._RUN_IS_STUB:
+            cls._CACHED_RUN_ARGS = _sig_params(cls.run)
+
     def __init__(self, *args, **kwargs):
         super(_InternalToolDockItemBase, self).__init__(*args, **kwargs)
         if not self.TOOL_LABEL:
@@ -186,21 +340,14 @@ class _InternalToolDockItemBase(QtWidgets.QWidget):
         self.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.open_context_menu)
         self.context_menu_actions = []
+        self._context_menu = None
+        self._context_menu_source = None  # action list the cached menu was built from
 
-        self._internal_context_menu_actions = [
-            {"Set Label": self.open_button_label_editor},
-            {"Set Background Color": self.open_background_color_picker},
-            "-",
-            {"Set Splitter - Vertical": partial(self.set_splitter_orientation, True)},
-            {"Set Splitter - Horizontal": partial(self.set_splitter_orientation, False)},
-            "-",
-            {"Reset Label": self.reset_tool_label},
-            {"Reset Background Color": self.reset_background_color},
-        ]
+        self._internal_context_menu_actions = None  # bound from _INTERNAL_CONTEXT_MENU_ACTIONS on first menu open
 
         if self.SCRIPT_PATH:
             self.context_menu_actions.insert(
-                0, {"Open in Script Editor": partial(dcc_interface.open_script_in_editor, self.SCRIPT_PATH)}
+                0, ("Open in Script Editor", partial(dcc_interface.open_script_in_editor, self.SCRIPT_PATH))
             )
             self.context_menu_actions.insert(1, "-")
 
@@ -216,21 +363,16 @@ class _InternalToolDockItemBase(QtWidgets.QWidget):
         # Splitter between parameter_grid and 'run' buttons
         self.main_splitter = QtWidgets.QSplitter()
 
-        # parameter grid
-        self.param_grid = parameter_grid.ParameterGrid()
-        self.param_grid.setSizePolicy(QtWidgets.QSizePolicy.Ignored, QtWidgets.QSizePolicy.Ignored)
-        self.param_grid.setHeaderHidden(True)
-        self.param_grid.setEditTriggers(self.param_grid.NoEditTriggers)
-        self.main_splitter.addWidget(self.param_grid)
+        # parameter grid is built on first access of self.param_grid
+        self._param_grid = None
 
         # build run buttons and add to splitter
+        self.main_ui_widget = None  # build_ui_widget overrides may already create the parameter grid
         self.main_ui_widget = self.build_ui_widget()
         self.main_splitter.addWidget(self.main_ui_widget)
-
-        # default hide parameter grid
-        self.main_splitter.handle(1).setEnabled(False)
-        self.main_splitter.setSizes([0, 100])
         self.main_layout.addWidget(self.main_splitter)
+        if self._param_grid is not None:
+            self._hide_param_grid_splitter()
 
         ####################################################################
         # get user color override
@@ -254,27 +396,97 @@ class _InternalToolDockItemBase(QtWidgets.QWidget):
             self.TOOL_LABEL = user_label_override
         self.set_tool_label(self.TOOL_LABEL)
 
+    @property
+    def param_grid(self):
+        """
+        Most tools are just a button, so the parameter grid is only built when something asks for it
+        :rtype: parameter_grid.ParameterGrid
+        """
+        if self._param_grid is None:
+            self._build_param_grid()
+        return self._param_grid
+
+    def has_param_grid(self):
+        return self._param_grid is not None
+
+    def get_parameters(self):
+        """parameters in the grid, without building the grid if it doesn't exist yet"""
+        return self._param_grid.parameters if self._param_grid is not None else []
+
+    def _build_param_grid(self):
+        # imported here so tool discovery doesn't need the widget modules
+        from tool_dock.ui import parameter_grid
+        self._param_grid = parameter_grid.ParameterGrid()
+        self._param_grid.setSizePolicy(QtWidgets.QSizePolicy.Ignored, QtWidgets.QSizePolicy.Ignored)
+        self._param_grid.setHeaderHidden(True)
+        self._param_grid.setEditTriggers(self._param_grid.NoEditTriggers)
+        self.main_splitter.insertWidget(0, self._param_grid)
+
+        # run widget doesn't exist yet when this is called from build_ui_widget, __init__ handles that case
+        if self.main_ui_widget is None:
+            return
+
+        self._hide_param_grid_splitter()
+        if self.BACKGROUND_COLOR:
+            self.set_background_color(self.BACKGROUND_COLOR)
+
+    def _hide_param_grid_splitter(self):
+        if self.main_splitter.count() < 2:
+            return
+
+        # default hide parameter grid
+        self.main_splitter.handle(1).setEnabled(False)
+        self.main_splitter.setSizes([0, 100])
+
+    def get_internal_context_menu_actions(self):
+        if self._internal_context_menu_actions is None:
+            self._internal_context_menu_actions = []
+            for action in self._INTERNAL_CONTEXT_MENU_ACTIONS:
+                if action == "-":
+                    self._internal_context_menu_actions.append(action)
+                    continue
+
+                action_title, method_name, method_args = action
+                action_command = getattr(self, method_name)
+                if method_args:
+                    action_command = partial(action_command, *method_args)
+                self._internal_context_menu_actions.append((action_title, action_command))
+
+        return self._internal_context_menu_actions
+
     def open_context_menu(self):
         action_list = copy(self.context_menu_actions)
         action_list.append("-")
-        action_list.extend(self._internal_context_menu_actions)
-        return ui_utils.build_menu_from_action_list(action_list)
+        action_list.extend(self.get_internal_context_menu_actions())
+
+        # only rebuild the menu if the actions have been changed since last time
+        if self._context_menu is None or action_list != self._context_menu_source:
+            if self._context_menu is not None:
+                self._context_menu.deleteLater()
+            self._context_menu = ui_utils.build_menu_from_action_list(action_list,
+                                                                      menu=QtWidgets.QMenu(self),
+                                                                      exec_now=False)
+            self._context_menu_source = action_list
+
+        self._context_menu.exec_(QtGui.QCursor.pos())
+        return self._context_menu
 
     def auto_populate_parameters(self):
         """Convenience function for generating parameters based on arguments of 'run'"""
-        run_arguments = get_func_arguments(self.run)
+        # base 'run' has nothing worth inspecting
+        if self._RUN_IS_STUB:
+            return
 
-        if not run_arguments:
+        if not self._CACHED_RUN_ARGS:
             return
 
         # ignore 'self' argument, should be safe-ish
-        if "self" in list(run_arguments.keys()):
-            run_arguments.pop("self")
-
-        for param_name, default_value in run_arguments.items():
-            is_required = default_value == RequiresValueType
-            if is_required:
-                run_arguments[param_name] = str()  # fill to make sure every argument has something
+        # and fill required arguments to make sure every argument has something
+        run_arguments = collections.OrderedDict(
+            (param_name, str() if default_value is RequiresValueType else default_value)
+            for param_name, default_value in self._CACHED_RUN_ARGS
+            if param_name != "self"
+        )
 
         if run_arguments:
             self.param_grid.from_data(run_arguments)
@@ -297,7 +509,7 @@ class _InternalToolDockItemBase(QtWidgets.QWidget):
                 btn = ui_utils.ContentResizeButton(name)
                 btn.setSizePolicy(QtWidgets.QSizePolicy.Ignored, QtWidgets.QSizePolicy.Ignored)
 
-                btn.clicked.connect(partial(self._run, func))
+                btn.clicked.connect(lambda checked=False, f=func: self._run(f))
                 multi_button_layout.addWidget(btn)
 
             multi_button_widget = QtWidgets.QWidget()
@@ -312,8 +524,9 @@ class _InternalToolDockItemBase(QtWidgets.QWidget):
             if self.ICON:
                 # if it's a string, assume it's a path to an icon image
                 if isinstance(self.ICON, str):
-                    self.ICON = QtGui.QIcon(self.ICON)
-                btn.setIcon(self.ICON)
+                    self.ICON = ui_utils.load_qicon(self.ICON)
+                if self.ICON:
+                    btn.setIcon(self.ICON)
 
             main_widget = btn
 
@@ -338,25 +551,18 @@ class _InternalToolDockItemBase(QtWidgets.QWidget):
         if isinstance(color, QtGui.QColor):
             color = color.getRgb()[:3]
 
-        param_grid_header = self.param_grid.header()  # type: QtWidgets.QHeaderView
-
         # reset colors
         if color is None:
-            self.main_ui_widget.setStyleSheet("")
-            self.param_grid.setStyleSheet("")
-            param_grid_header.setStyleSheet("")
-            return
-
-        # use subtler color equivalent for parameter grid
-        col = QtGui.QColor()
-        col.setRgb(*color)
-        col.setHsv(col.hue(), col.saturation() * 0.5, col.value() * 0.5)
-        subtle_color = col.getRgb()[:3]
+            background_style, param_grid_style = "", ""
+        else:
+            background_style, param_grid_style = get_background_stylesheets(tuple(color))
 
         # set colors on widgets
-        self.main_ui_widget.setStyleSheet(background_form.format(*color))
-        self.param_grid.setStyleSheet("QTreeView{{background-color:rgb({},{},{})}}".format(*subtle_color))
-        param_grid_header.setStyleSheet(background_form.format(*color))
+        if self.main_ui_widget is not None:
+            self.main_ui_widget.setStyleSheet(background_style)
+        if self._param_grid is not None:
+            self._param_grid.setStyleSheet(param_grid_style)
+            self._param_grid.header().setStyleSheet(background_style)
 
     def reset_background_color(self):
         self.set_background_color(self._default_background_color)
@@ -398,11 +604,13 @@ class _InternalToolDockItemBase(QtWidgets.QWidget):
     def post_init(self):
         # auto generate parameter widgets if run function has arguments
         # skip if parameters have been manually defined
-        if not self.param_grid.parameters:
+        parameters = self.get_parameters()
+        if not parameters:
             self.auto_populate_parameters()
+            parameters = self.get_parameters()
 
         # show parameter grid if parameters are defined
-        if self.param_grid.parameters:
+        if parameters:
             self.main_splitter.handle(1).setEnabled(True)
             self.main_splitter.setSizes([1, 1])
         else:
@@ -440,23 +648,14 @@ class ToolDockItemBase(_InternalToolDockItemBase):
 
 
 def import_extra_modules(refresh=False):
-    modules_to_import = os.environ.get(lk.env_extra_modules, "").split(";")
+    modules_to_import = [m for m in os.environ.get(lk.env_extra_modules, "").split(";") if m]  # skip empty strings
 
     if refresh:
-        for mod_key in sys.modules.keys():
-            for module_import_str in modules_to_import:
-
-                if not module_import_str:  # skip empty strings
-                    continue
-
-                # pop up out all submodule of imported module
-                if module_import_str in mod_key:
-                    sys.modules.pop(mod_key)
-                    continue
-
-            if mod_key.startswith(lk.extension_path_prefix):
-                sys.modules.pop(mod_key)
-                continue
+        # pop out all imported extension modules and their submodules
+        refresh_prefixes = tuple(modules_to_import) + (lk.extension_path_prefix,)
+        for mod_key in list(sys.modules):  # list copy, since sys.modules is modified in the loop
+            if mod_key.startswith(refresh_prefixes):
+                sys.modules.pop(mod_key, None)
 
     # search in sys.paths for tool_dock_ext modules and packages, then import them
     for sys_path in sys.path:
@@ -477,7 +676,7 @@ def import_extra_modules(refresh=False):
 
     # import modules defined in environment variable
     for module_import_str in modules_to_import:
-        if not module_import_str:  # skip empty strings
+        if module_import_str in sys.modules:  # already imported, nothing to do
             continue
 
         try:
@@ -487,26 +686,32 @@ def import_extra_modules(refresh=False):
             traceback.print_exc()
 
 
-def get_func_arguments(func):
-    """ copied from https://github.com/rBrenick/argument-dialog """
-    if PY_2:
-        arg_spec = inspect.getargspec(func)
-    else:
-        arg_spec = inspect.getfullargspec(func)
-
-    parameter_dict = collections.OrderedDict()
-    for param_name in arg_spec.args:
-        parameter_dict[param_name] = RequiresValueType  # argument has no default value, not even a 'None'
+@lru_cache(maxsize=None)
+def _sig_params(func):
+    """(name, default) pairs of func arguments, a function signature doesn't change at runtime"""
+    return tuple(
+        (p.name, RequiresValueType if p.default is inspect.Parameter.empty else p.default)
+        for p in inspect.signature(func).parameters.values()
+        if p.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+    )
 
-    if arg_spec.defaults:
-        for param_value, param_key in zip(arg_spec.defaults[::-1], reversed(parameter_dict.keys())):  # fill in defaults
-            parameter_dict[param_key] = param_value
 
-    return parameter_dict
+def get_func_arguments(func):
+    """ copied from https://github.com/rBrenick/argument-dialog """
+    # build a fresh dict every call, callers are allowed to modify it
+    # arguments without a default value are marked with RequiresValueType, not even a 'None'
+    return collections.OrderedDict(_sig_params(func))
 
 
 def all_subclasses(cls):
-    return set(cls.__subclasses__()).union([s for c in cls.__subclasses__() for s in all_subclasses(c)])
+    seen = set()
+    stack = [cls]
+    while stack:
+        for sub_cls in stack.pop().__subclasses__():
+            if sub_cls not in seen:  # classes with multiple bases are only walked once
+                seen.add(sub_cls)
+                stack.append(sub_cls)
+    return seen
 
 
 def get_tool_classes():
@@ -519,6 +724,25 @@ def get_tool_classes():
     return subclasses
 
 
+@lru_cache(maxsize=128)
+def get_background_stylesheets(color):
+    """
+    Stylesheets for a tool background color, tools sharing a color only format them once
+    :param color: (r, g, b) values
+    :type color: tuple
+    :return: button stylesheet, parameter grid stylesheet
+    """
+    # use subtler color equivalent for parameter grid
+    col = QtGui.QColor()
+    col.setRgb(*color)
+    col.setHsv(col.hue(), col.saturation() * 0.5, col.value() * 0.5)
+    subtle_color = col.getRgb()[:3]
+
+    background_style = background_form.format(*color)
+    param_grid_style = "QTreeView{{background-color:rgb({},{},{})}}".format(*subtle_color)
+    return background_style, param_grid_style
+
+
 def get_preview_from_script_path(script_path, max_line_count=None):
     """
     Open file and read a couple of lines
@@ -529,13 +753,14 @@ def get_preview_from_script_path(script_path, max_line_count=None):
     :return:
     """
     with open(script_path, "r") as fp:
-        script_lines = fp.readlines()
-
-    if max_line_count is None:
-        max_line_count = len(script_lines)
+        if max_line_count is None:
+            script_lines = fp.readlines()
+        else:
+            # one extra line to know if the script got truncated, without reading the rest of the file
+            script_lines = list(itertools.islice(fp, max_line_count + 1))
 
     script_code = "".join(script_lines[:max_line_count])
-    if len(script_lines) > max_line_count:
+    if max_line_count is not None and len(script_lines) > max_line_count:
         script_code = "{}......".format(script_code)  # indicators that script is truncated
 
     preview_str = "{}\n\n{}\n".format(script_path, script_code)
@@ -560,24 +785,176 @@ def get_tool_tip_from_tool(tool_cls):
     return "{}\n{}".format(tool_cls.TOOL_NAME, tool_cls.TOOL_TIP)
 
 
-def make_class_from_script(script_path, tool_name):
-    class DynamicClass(_InternalToolDockItemBase):
-        TOOL_NAME = tool_name
-        TOOL_TIP = script_path
-        SCRIPT_PATH = script_path
+# compiled script code, reused until the script file is modified
+_script_code_cache = {}  # script_path: (mtime, code)
 
-        def run(self):
-            return runpy.run_path(script_path, init_globals=globals(), run_name="__main__")
 
-    return DynamicClass
+def get_script_code(script_path):
+    script_mtime = os.path.getmtime(script_path)
 
+    cached_code = _script_code_cache.get(script_path)
+    if cached_code and cached_code[0] == script_mtime:
+        return cached_code[1]
 
-def get_paths_in_folder(root_folder, extension_filter=""):
-    for folder, _, file_names in os.walk(root_folder):
+    with open(script_path, "rb") as fp:
+        script_code = compile(fp.read(), script_path, "exec")
+
+    _script_code_cache[script_path] = (script_mtime, script_code)
+    return script_code
+
+
+def run_script(script_path, init_globals=None):
+    """Execute script as __main__, like runpy.run_path but without parsing the file on every run"""
+    script_globals = dict(init_globals) if init_globals else {}
+    script_globals.update(__name__="__main__", __file__=script_path,
+                          __package__=None, __spec__=None, __loader__=None, __cached__=None)
+    exec(get_script_code(script_path), script_globals)
+    return script_globals
+
+
+def _run_tool_script(self):
+    """'run' shared by all classes from make_class_from_script"""
+    return run_script(self.SCRIPT_PATH, init_globals=globals())
+
+
+def make_class_from_script(script_path, tool_name):
+    # no class body to execute per script, every script class shares the same run function
+    tool_metaclass = type(_InternalToolDockItemBase)
+    return tool_metaclass("DynamicClass", (_InternalToolDockItemBase,), {
+        "TOOL_NAME": tool_name,
+        "TOOL_TIP": script_path,
+        "SCRIPT_PATH": script_path,
+        "run": _run_tool_script,
+    })
+
+
+# folder contents from previous runs, script folders can live on slow network drives
+_walk_cache_path = os.path.join(tempfile.gettempdir(), "tool_dock_walk.cache")
+_walk_cache = None
+_walk_cache_changed = False
+_walk_cache_listed = set()  # folders listed this run, the rest of the cache is pruned on save
+_walk_cache_racy_seconds = 2.0  # mtime resolution of FAT and some network shares
+
+
+def _get_walk_cache():
+    global _walk_cache
+    if _walk_cache is None:
+        _walk_cache = {}
+        if os.path.exists(_walk_cache_path):
+            try:
+                with open(_walk_cache_path, "r") as fp:
+                    _walk_cache = json.load(fp)
+            except (IOError, ValueError) as e:
+                print("Failed to read folder cache: {}".format(e))
+
+        atexit.register(_save_walk_cache)
+    return _walk_cache
+
+
+def _save_walk_cache():
+    # drop folders that were deleted or aren't in the script folders anymore
+    walk_cache = {folder: data for folder, data in dict(_walk_cache).items() if folder in _walk_cache_listed}
+    if not _walk_cache_changed and len(walk_cache) == len(_walk_cache):
+        return  # script folders are the same as last run, no need to write the file again
+
+    # other DCC sessions may be reading the cache, so replace the file instead of writing into it
+    temp_path = "{}.{}.tmp".format(_walk_cache_path, os.getpid())
+    try:
+        with open(temp_path, "w") as fp:
+            json.dump(walk_cache, fp)
+        os.replace(temp_path, _walk_cache_path)
+    except (IOError, OSError) as e:
+        print("Failed to save folder cache: {}".format(e))
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def _list_folder(folder):
+    """
+    Get sub folder and file names in folder
+    the contents are reused from the cache as long as the folder modification time hasn't changed
+    :param folder: folder path
+    :type folder: str
+    :return: sub folder names, file names
+    """
+    global _walk_cache_changed
+    walk_cache = _get_walk_cache()
+    folder_mtime = os.stat(folder).st_mtime
+    _walk_cache_listed.add(folder)
+
+    cached_data = walk_cache.get(folder)
+    if cached_data and cached_data[0] == folder_mtime:
+        return cached_data[1], cached_data[2]
+
+    # DirEntry caches the file type from the folder listing, so this doesn't need a stat per file
+    sub_folders = []
+    file_names = []
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                sub_folders.append(entry.name)
+            elif not entry.is_symlink() or not entry.is_dir():  # same as os.walk, linked folders are skipped
+                file_names.append(entry.name)
+
+    # files added later in the same mtime tick wouldn't change the mtime, so don't trust recently modified folders
+    if time.time() - folder_mtime < _walk_cache_racy_seconds:
+        if walk_cache.pop(folder, None) is not None:
+            _walk_cache_changed = True
+        return sub_folders, file_names
+
+    walk_cache[folder] = [folder_mtime, sub_folders, file_names]
+    _walk_cache_changed = True
+    return sub_folders, file_names
+
+
+def _try_list_folder(folder):
+    try:
+        return _list_folder(folder)
+    except OSError:
+        return None  # unreadable folder, skip it like os.walk does
+
+
+def get_paths_in_folder(root_folder, extension_filter="", executor=None):
+    """
+    Get file paths in folder structure, in the same order as os.walk
+    :param root_folder: folder to search
+    :param extension_filter: only include files ending with this
+    :param executor: optional concurrent.futures executor, every folder on a level is listed at the same time
+    """
+    _get_walk_cache()  # load before any worker threads start using it
+    map_func = executor.map if executor else map
+
+    # list the folder structure one level at a time, so the slow listings can run in parallel
+    folder_contents = {}
+    level_folders = [root_folder]
+    while level_folders:
+        next_level_folders = []
+        for folder, contents in zip(level_folders, map_func(_try_list_folder, level_folders)):
+            if contents is None:
+                continue
+            folder_contents[folder] = contents
+            next_level_folders.extend(os.path.join(folder, sub_folder) for sub_folder in contents[0])
+        level_folders = next_level_folders
+
+    folders = [root_folder]
+    while folders:
+        folder = folders.pop()
+        contents = folder_contents.get(folder)
+        if contents is None:
+            continue
+
+        sub_folders, file_names = contents
         for file_name in file_names:
             if file_name.endswith(extension_filter):
                 yield os.path.join(folder, file_name)
 
+        # reversed so folders are visited in the same order as os.walk
+        folders.extend(os.path.join(folder, sub_folder) for sub_folder in reversed(sub_folders))
+
+
+def get_script_paths_in_folder(root_folder, executor=None):
+    return list(get_paths_in_folder(root_folder, extension_filter=".py", executor=executor))
+
 
 def browse_for_settings_path(save=False):
     dialog = QtWidgets.QFileDialog(ui_utils.get_app_window())
@@ -609,12 +986,13 @@ def save_tooldock_settings(settings, current_tooldock, settings_path=None):
 
     out_settings = ToolDockSettings(settings_path, QtCore.QSettings.IniFormat)
 
-    for setting_key in settings.allKeys():  # type: str
-        if not setting_key.startswith(current_tooldock):
-            continue
+    for setting_key in settings.get_keys_in_group(current_tooldock):  # type: str
         out_settings.setValue(setting_key, settings.get_value(setting_key))
 
     out_settings.setValue("tooldock", current_tooldock)
+
+    # write the file once with all values, instead of leaving it to QSettings' own flush timing
+    out_settings.sync()
     return settings_path
 
 
@@ -637,14 +1015,18 @@ def load_tooldock_settings(target_settings=None, target_tooldock="", source_sett
         source_settings = ToolDockSettings(source_settings, QtCore.QSettings.IniFormat)
 
     settings_tooldock = source_settings.get_value("tooldock")
+    if not settings_tooldock:
+        print("No tooldock defined in settings: {}".format(source_settings.fileName()))
+        return
 
-    for setting_key in source_settings.allKeys():  # type: str
-        if not setting_key.startswith(settings_tooldock):
-            continue
-
+    for setting_key in source_settings.get_keys_in_group(settings_tooldock):  # type: str
         # save data in current tooldock
-        key = setting_key.replace(settings_tooldock, target_tooldock)
+        key = target_tooldock + setting_key[len(settings_tooldock):]
 
         target_settings.setValue(key, source_settings.get_value(setting_key))
 
     return True
+
+
+# start looking for scripts on import, the results are picked up by get_tool_classes
+lk.start_script_folder_search()
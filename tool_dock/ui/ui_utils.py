@@ -9,15 +9,16 @@ if sys.version_info[0] >= 3:
 # Not even going to pretend to have Maya 2016 support
 from PySide2 import QtCore
 from PySide2 import QtGui
-from PySide2 import QtUiTools
 from PySide2 import QtWidgets
 
 UI_FILES_FOLDER = os.path.dirname(__file__)
 ICON_FOLDER = os.path.join(os.path.dirname(os.path.dirname(__file__)), "icons")
 Q_APP = QtWidgets.QApplication.instance()  # type: QtWidgets.QApplication
 
-currently_using_maya = os.path.basename(sys.executable) == "maya.exe"
-currently_using_mobu = os.path.basename(sys.executable) == "motionbuilder.exe"
+# maya.exe on Windows, maya / maya.bin on Linux and macOS
+executable_name = os.path.splitext(os.path.basename(sys.executable))[0].lower()
+currently_using_maya = executable_name == "maya"
+currently_using_mobu = executable_name == "motionbuilder"
 
 if currently_using_maya:
     dcc_name = "Maya"
@@ -31,7 +32,19 @@ QT UTILS BEGIN
 """
 
 
+_MAIN_WINDOW_CACHE = None
+
+
 def get_app_window():
+    global _MAIN_WINDOW_CACHE
+    if _MAIN_WINDOW_CACHE is not None:
+        return _MAIN_WINDOW_CACHE
+
+    _MAIN_WINDOW_CACHE = _find_app_window()
+    return _MAIN_WINDOW_CACHE
+
+
+def _find_app_window():
     top_window = None
     if currently_using_maya:
         try:
@@ -69,11 +82,14 @@ def delete_window(object_to_delete):
     if not qApp:
         return
 
+    # class name is compared as well, so windows created before a module reload are found too
+    object_cls = type(object_to_delete)
+    object_cls_str = str(object_cls)
     for widget in qApp.topLevelWidgets():
-        if "__class__" in dir(widget):
-            if str(widget.__class__) == str(object_to_delete.__class__):
-                widget.deleteLater()
-                widget.close()
+        widget_cls = type(widget)
+        if widget_cls is object_cls or str(widget_cls) == object_cls_str:
+            widget.deleteLater()
+            widget.close()
 
 
 def load_ui_file(ui_file_name):
@@ -82,6 +98,8 @@ def load_ui_file(ui_file_name):
         sys.stdout.write("UI FILE NOT FOUND: {}\n".format(ui_file_path))
         return None
 
+    from PySide2 import QtUiTools  # only needed for .ui files, skip the import cost on startup
+
     ui_file = QtCore.QFile(ui_file_path)
     ui_file.open(QtCore.QFile.ReadOnly)
     loader = QtUiTools.QUiLoader()
@@ -90,14 +108,26 @@ def load_ui_file(ui_file_name):
     return window
 
 
+@functools.lru_cache(maxsize=256)
+def _load_icon(icon_path):
+    """icons are shared between widgets, so only read each image from disk once"""
+    return QtGui.QIcon(icon_path) if os.path.exists(icon_path) else None
+
+
+def load_qicon(icon_path):
+    """cached QIcon from a full image path, None if the file doesn't exist"""
+    return _load_icon(icon_path.replace("\\", "/"))
+
+
 def create_qicon(icon_path):
+    if icon_path is None:
+        return None
+
     icon_path = icon_path.replace("\\", "/")
     if "/" not in icon_path:
         icon_path = os.path.join(ICON_FOLDER, icon_path + ".png")  # find in icons folder if not full path
-        if not os.path.exists(icon_path):
-            return
 
-    return QtGui.QIcon(icon_path)
+    return load_qicon(icon_path)
 
 
 class BaseWindow(QtWidgets.QMainWindow):
@@ -267,61 +297,76 @@ else:
         return win.windowTitle()
 
 
-def build_menu_from_action_list(actions, menu=None, is_sub_menu=False):
+def _iter_menu_actions(actions):
+    """
+    Yield "-" separators and (title, command) tuples from an action list
+    dicts of {title: command} are still accepted for backwards compatibility
+    """
+    for action in actions:
+        if isinstance(action, dict):
+            for action_item in action.items():
+                yield action_item
+        else:
+            yield action
+
+
+def build_menu_from_action_list(actions, menu=None, is_sub_menu=False, exec_now=True):
     if not menu:
         menu = QtWidgets.QMenu()
 
-    for action in actions:
+    for action in _iter_menu_actions(actions):
         if action == "-":
             menu.addSeparator()
             continue
 
-        for action_title, action_command in action.items():
-            if action_title == "RADIO_SETTING":
-                # Create RadioButtons for QSettings object
-                settings_obj = action_command.get("settings")  # type: QtCore.QSettings
-                settings_key = action_command.get("settings_key")  # type: str
-                choices = action_command.get("choices")  # type: list
-                default_choice = action_command.get("default")  # type: str
-                on_trigger_command = action_command.get("on_trigger_command")  # function to trigger after setting value
-
-                # Has choice been defined in settings?
-                item_to_check = settings_obj.value(settings_key)
-
-                # If not, read from default option argument
-                if not item_to_check:
-                    item_to_check = default_choice
-
-                grp = QtWidgets.QActionGroup(menu)
-                for choice_key in choices:
-                    action = QtWidgets.QAction(choice_key, menu)
-                    action.setCheckable(True)
-
-                    if choice_key == item_to_check:
-                        action.setChecked(True)
-
-                    action.triggered.connect(functools.partial(set_settings_value,
-                                                               settings_obj,
-                                                               settings_key,
-                                                               choice_key,
-                                                               on_trigger_command))
-                    menu.addAction(action)
-                    grp.addAction(action)
-
-                grp.setExclusive(True)
-                continue
-
-            if isinstance(action_command, list):
-                sub_menu = menu.addMenu(action_title)
-                build_menu_from_action_list(action_command, menu=sub_menu, is_sub_menu=True)
-                continue
-
-            atn = menu.addAction(action_title)
-            atn.triggered.connect(action_command)
-
-    if not is_sub_menu:
-        cursor = QtGui.QCursor()
-        menu.exec_(cursor.pos())
+        action_title, action_command = action
+
+        if action_title == "RADIO_SETTING":
+            # Create RadioButtons for QSettings object
+            settings_obj = action_command.get("settings")  # type: QtCore.QSettings
+            settings_key = action_command.get("settings_key")  # type: str
+            choices = action_command.get("choices")  # type: list
+            default_choice = action_command.get("default")  # type: str
+            on_trigger_command = action_command.get("on_trigger_command")  # function to trigger after setting value
+
+            # Has choice been defined in settings?
+            item_to_check = settings_obj.value(settings_key)
+
+            # If not, read from default option argument
+            if not item_to_check:
+                item_to_check = default_choice
+
+            # one closure per choice, the settings object and key are shared
+            def make_choice_command(choice, settings_obj=settings_obj, settings_key=settings_key,
+                                    on_trigger_command=on_trigger_command):
+                return lambda checked=False: set_settings_value(settings_obj, settings_key, choice,
+                                                                on_trigger_command)
+
+            grp = QtWidgets.QActionGroup(menu)
+            for choice_key in choices:
+                action = QtWidgets.QAction(choice_key, menu)
+                action.setCheckable(True)
+
+                if choice_key == item_to_check:
+                    action.setChecked(True)
+
+                action.triggered.connect(make_choice_command(choice_key))
+                menu.addAction(action)
+                grp.addAction(action)
+
+            grp.setExclusive(True)
+            continue
+
+        if isinstance(action_command, list):
+            sub_menu = menu.addMenu(action_title)
+            build_menu_from_action_list(action_command, menu=sub_menu, is_sub_menu=True)
+            continue
+
+        atn = menu.addAction(action_title)
+        atn.triggered.connect(action_command)
+
+    if exec_now and not is_sub_menu:
+        menu.exec_(QtGui.QCursor.pos())
 
     return menu
 
@@ -339,8 +384,9 @@ def toggle_list_widget_item_checked(item):
 
 
 def get_list_widget_items(list_widget):
+    get_item = list_widget.item
     for item_index in range(list_widget.count()):
-        yield list_widget.item(item_index)
+        yield get_item(item_index)
 
 
 def process_q_events():